@@ -1,5 +1,6 @@
 import math
 import sys
+import time
 import pygame
 
 # -----------------------------
@@ -7,6 +8,7 @@ import pygame
 # -----------------------------
 WIDTH, HEIGHT = 900, 520
 FPS = 60
+PHYS_DT = 1.0 / 120.0  # fixed physics step; rendering interpolates between steps
 SKY_COLOR = (135, 206, 235)
 GROUND_COLOR = (60, 120, 60)
 PAD_A_COLOR = (200, 200, 60)
@@ -28,6 +30,13 @@ GROUND_Y = HEIGHT - 120
 # World layout for illusion of horizontal movement (background scroll)
 PAD_A_X = 50
 PAD_B_X = 1500  # Point B far to the right in world coordinates
+SCROLL_MIN = -200   # leftmost allowed scroll offset
+SCROLL_MAX = 2000   # rightmost allowed scroll offset
+# Baked layer geometry: layers are drawn at world_x + WORLD_MARGIN so the
+# slice rect stays inside the surface across the whole scroll range.
+WORLD_MARGIN = -SCROLL_MIN
+WORLD_W = SCROLL_MAX + WIDTH + WORLD_MARGIN
+CLOUD_TILE_W = 2000  # cloud layer repeat period (clouds wrap; landmarks don't)
 
 # Motion tuning (time-based)
 MAX_ROTOR_SPEED = 18.0  # rad/s (main rotor) - faster for visual effect
@@ -40,6 +49,32 @@ MANUAL_HORI_SPEED = 220.0    # px/s horizontal speed for keyboard control
 MANUAL_VERT_SPEED = 150.0    # px/s vertical speed for keyboard control
 GRAVITY = 80.0               # px/s gravity pull when not pressing W
 MIN_FLIGHT_ROTOR_SPEED = 12.0  # minimum rotor speed needed for lift
+ROTOR_FRAMES = 32            # pre-rendered main rotor orientations (power of 2)
+
+# Control keys, bound once so the per-frame reads skip attribute lookups
+_K_W, _K_A, _K_S, _K_D = pygame.K_w, pygame.K_a, pygame.K_s, pygame.K_d
+
+# Derived physics constants, folded once so the per-frame step is pure
+# multiply/add (divisions out of the hot path)
+_TWO_PI = 2 * math.pi
+_INV_MIN_FLIGHT_ROTOR_SPEED = 1.0 / MIN_FLIGHT_ROTOR_SPEED
+_ROTOR_LIFT_PER_SPEED = GRAVITY * 0.8 / MAX_ROTOR_SPEED
+_PARTIAL_LIFT_ROTOR_SPEED = MIN_FLIGHT_ROTOR_SPEED * 0.5
+_ROTOR_FRAME_SCALE = ROTOR_FRAMES / _TWO_PI
+
+# Sin/cos lookup table for per-frame animation trig; 1024 steps over a
+# full turn is far below visible error and a list index is cheaper than
+# a libm call in the draw hot path.
+_LUT_SIZE = 1024
+_LUT_SCALE = _LUT_SIZE / (2 * math.pi)
+_SIN = [math.sin(2 * math.pi * i / _LUT_SIZE) for i in range(_LUT_SIZE)]
+_COS = [math.cos(2 * math.pi * i / _LUT_SIZE) for i in range(_LUT_SIZE)]
+
+
+def _trig(angle):
+    """Return (cos, sin) of angle via table lookup."""
+    i = int(angle * _LUT_SCALE) & (_LUT_SIZE - 1)
+    return _COS[i], _SIN[i]
 
 # -----------------------------
 # State Machine
@@ -52,6 +87,10 @@ class FlightState:
     SPIN_DOWN = 4      # Landed, rotors decelerating
 
 
+# Display names indexed by FlightState value
+_STATE_NAMES = ("IDLE", "SPINNING UP", "FLYING", "LANDING", "SPIN DOWN")
+
+
 # -----------------------------
 # Background (world) rendering and scrolling
 # -----------------------------
@@ -76,68 +115,149 @@ class Background:
             size = 52 + (i % 5) * 10  # varied foliage size
             self.trees.append((tx, size))
         # Grass patches for more realistic ground
-        self.grass_patches = []  # each item: (x, y_offset, blade_heights)
+        self.grass_patches = []  # each item: (x, y_offset, blades)
         for i in range(0, 200):
             gx = i * 30 + int(15 * math.sin(i * 1.3))
             gy_offset = 5 + (i % 4) * 8  # varied y position on ground
-            # Generate varied blade heights for each patch
-            blade_heights = [8 + (j * 3 + i) % 12 for j in range(5)]
-            self.grass_patches.append((gx, gy_offset, blade_heights))
+            # Blade heights and sway are deterministic per patch, so bake
+            # them here instead of recomputing sin per blade at draw time
+            blades = [(8 + (j * 3 + i) % 12, int(2 * math.sin(gx * 0.1 + j)))
+                      for j in range(5)]
+            self.grass_patches.append((gx, gy_offset, blades))
+        # Bake all static scenery into per-parallax-layer surfaces once;
+        # per-frame drawing is then a handful of blits instead of hundreds
+        # of pygame.draw calls.
+        self.cloud_layer = pygame.Surface((CLOUD_TILE_W, HEIGHT), pygame.SRCALPHA)
+        self.far_layer = pygame.Surface((WORLD_W, HEIGHT), pygame.SRCALPHA)
+        self.near_layer = pygame.Surface((WORLD_W, HEIGHT), pygame.SRCALPHA)
+        self._bake()
+        self.cloud_layer = self.cloud_layer.convert_alpha()
+        self.far_layer = self.far_layer.convert_alpha()
+        self.near_layer = self.near_layer.convert_alpha()
+
+    def _bake(self):
+        """One-shot render of the static scenery into the layer surfaces."""
+        # All clouds share one shape, so rasterize it once and stamp it.
+        # The cloud layer is a repeating tile: clouds carry no landmark
+        # meaning, so they wrap with the scroll instead of running out.
+        self._cloud_surf = pygame.Surface((80, 48), pygame.SRCALPHA)
+        self._draw_cloud(self._cloud_surf, 36, 20)
+        self._cloud_surf = self._cloud_surf.convert_alpha()
+        self.cloud_layer.fblits([(self._cloud_surf, (cx % CLOUD_TILE_W - 36, cy - 20))
+                                 for cx, cy in self.clouds])
+        # Each building (block + roofline + rounded-rect window grid) is
+        # rasterized once into its own surface, then placed on the layer;
+        # border_radius rects are a slow software path best paid only here.
+        # Windows come in exactly two looks, so pre-render a lit and a dark
+        # tile (rounded corners baked in) and stamp them per window
+        self._win_lit = pygame.Surface((12, 14), pygame.SRCALPHA)
+        pygame.draw.rect(self._win_lit, WINDOW_LIT_COLOR, (0, 0, 12, 14), border_radius=2)
+        self._win_dark = pygame.Surface((12, 14), pygame.SRCALPHA)
+        pygame.draw.rect(self._win_dark, WINDOW_DARK_COLOR, (0, 0, 12, 14), border_radius=2)
+        self._win_lit = self._win_lit.convert_alpha()
+        self._win_dark = self._win_dark.convert_alpha()
+        self._building_surfs = []
+        for bx, bw, bh in self.buildings:
+            surf = self._render_building(bw, bh).convert_alpha()
+            self._building_surfs.append(surf)
+            self.far_layer.blit(surf, (bx + WORLD_MARGIN, GROUND_Y - bh - 4))
+        # Ground band first so the grass/stripes/trees/pads sit on top of it;
+        # it spans the full layer width so every slice is covered. Hold the
+        # surface lock across the whole primitive batch: each pygame.draw
+        # call otherwise locks/unlocks the pixel buffer on its own, which
+        # adds up over ~1000 grass blades.
+        self.near_layer.lock()
+        pygame.draw.rect(self.near_layer, GROUND_COLOR,
+                         (0, GROUND_Y, WORLD_W, HEIGHT - GROUND_Y))
+        for gx, gy_offset, blades in self.grass_patches:
+            self._draw_grass_patch(self.near_layer, gx + WORLD_MARGIN,
+                                   GROUND_Y + gy_offset, blades)
+        self.near_layer.unlock()
+        # Stripes repeat on a fixed 120px period, so tile one stripe
+        # surface across the layer instead of drawing individual rects
+        self._stripe_tile = pygame.Surface((120, 10), pygame.SRCALPHA)
+        self._stripe_tile.fill((70, 140, 70), (0, 0, 40, 10))
+        self._stripe_tile = self._stripe_tile.convert_alpha()
+        for x in self.stripes:
+            self.near_layer.blit(self._stripe_tile, (x + WORLD_MARGIN, GROUND_Y + 20))
+        # Trees take only 5 distinct sizes, so rasterize one sprite per
+        # size and stamp those instead of redrawing trunk+foliage per tree
+        # (fblits keeps its source-surface cache warm when the same sprite
+        # repeats, so group the stamps by size)
+        self._tree_sprites = {}
+        tree_blits = []
+        for tx, size in sorted(self.trees, key=lambda t: t[1]):
+            sprite = self._tree_sprites.get(size)
+            if sprite is None:
+                sprite = self._render_tree(size).convert_alpha()
+                self._tree_sprites[size] = sprite
+            tree_blits.append((sprite, (tx + WORLD_MARGIN - sprite.get_width() // 2,
+                                        GROUND_Y - sprite.get_height())))
+        self.near_layer.fblits(tree_blits)
+        # Pads scroll at the near layer's 1.0x factor, so they bake too
+        pygame.draw.rect(self.near_layer, PAD_A_COLOR,
+                         (PAD_A_X + WORLD_MARGIN - 40, GROUND_Y - 4, 80, 8))
+        pygame.draw.rect(self.near_layer, PAD_B_COLOR,
+                         (PAD_B_X + WORLD_MARGIN - 40, GROUND_Y - 4, 80, 8))
+
+    def _render_tree(self, size):
+        # sprite sized to the tree's bounding box, trunk base at the bottom
+        trunk_h = max(28, size // 2)
+        r1 = max(14, size // 3)
+        r2 = max(12, size // 4)
+        w = 2 * (r1 + r2 + 6)
+        h = trunk_h + r1 + 8
+        surf = pygame.Surface((w, h), pygame.SRCALPHA)
+        self._draw_tree(surf, w // 2, h, size)
+        return surf
 
     def update_scroll(self, dt, direction=0):
         """Update background scroll based on movement direction (-1=left, 0=none, 1=right)"""
         if direction != 0:
             self.offset_x += direction * FLIGHT_SCROLL_SPEED * dt
             # Clamp offset to reasonable bounds
-            self.offset_x = max(-200, min(2000, self.offset_x))
-
-    def draw(self, screen):
+            self.offset_x = max(SCROLL_MIN, min(SCROLL_MAX, self.offset_x))
+
+    def draw(self, screen, offset_x=None):
+        # Snapshot the scroll offset (callers may pass an interpolated one)
+        # and derive each parallax offset once
+        if offset_x is None:
+            offset_x = self.offset_x
+        o05 = int(offset_x * 0.5)
+        o08 = int(offset_x * 0.8)
+        o10 = int(offset_x)
         # Sky
         screen.fill(SKY_COLOR)
-        # Clouds (farther layer: move slightly slower for parallax)
-        for cx, cy in self.clouds:
-            sx = int(cx - self.offset_x * 0.5)
-            self._draw_cloud(screen, sx, cy)
-        # Buildings (far layer)
-        for bx, bw, bh in self.buildings:
-            sx = int(bx - self.offset_x * 0.8)
-            # draw building grounded: top at GROUND_Y - height
-            self._draw_building(screen, sx, bw, bh)
-        # Ground
-        pygame.draw.rect(screen, GROUND_COLOR, (0, GROUND_Y, WIDTH, HEIGHT - GROUND_Y))
-        # Grass patches (draw on ground for realistic texture)
-        for gx, gy_offset, blade_heights in self.grass_patches:
-            sx = int(gx - self.offset_x)
-            if -20 < sx < WIDTH + 20:
-                self._draw_grass_patch(screen, sx, GROUND_Y + gy_offset, blade_heights)
-        # Ground stripes (near layer: fastest parallax)
-        for x in self.stripes:
-            sx = int(x - self.offset_x)
-            pygame.draw.rect(screen, (70, 140, 70), (sx, GROUND_Y + 20, 40, 10))
-        # Trees (near layer): draw after ground so they sit on it
-        for tx, size in self.trees:
-            sx = int(tx - self.offset_x)
-            # small cull to avoid overdraw off-screen
-            if -80 < sx < WIDTH + 80:
-                self._draw_tree(screen, sx, GROUND_Y, size)
-        # Pads
-        pad_a_screen_x = int(PAD_A_X - self.offset_x)
-        pad_b_screen_x = int(PAD_B_X - self.offset_x)
-        pygame.draw.rect(screen, PAD_A_COLOR, (pad_a_screen_x - 40, GROUND_Y - 4, 80, 8))
-        pygame.draw.rect(screen, PAD_B_COLOR, (pad_b_screen_x - 40, GROUND_Y - 4, 80, 8))
+        # Baked layers: one slice blit each, offset by the parallax factor
+        # (clouds farthest/slowest, buildings mid, ground detail nearest).
+        # Clouds wrap on their tile period; two blits cover the viewport.
+        # The whole stack goes through one blits() call (doreturn=0 skips
+        # building the result-rect list).
+        cloud_sx = -(o05 % CLOUD_TILE_W)
+        blit_list = [(self.cloud_layer, (cloud_sx, 0))]
+        if cloud_sx + CLOUD_TILE_W < WIDTH:
+            blit_list.append((self.cloud_layer, (cloud_sx + CLOUD_TILE_W, 0)))
+        blit_list.append((self.far_layer, (0, 0),
+                          pygame.Rect(o08 + WORLD_MARGIN, 0, WIDTH, HEIGHT)))
+        # Ground, grass, stripes, trees and pads all live in the near layer
+        blit_list.append((self.near_layer, (0, 0),
+                          pygame.Rect(o10 + WORLD_MARGIN, 0, WIDTH, HEIGHT)))
+        screen.blits(blit_list, doreturn=0)
 
     def _draw_cloud(self, screen, x, y):
         pygame.draw.circle(screen, CLOUD_COLOR, (x, y), 18)
         pygame.draw.circle(screen, CLOUD_COLOR, (x + 20, y + 5), 22)
         pygame.draw.circle(screen, CLOUD_COLOR, (x - 18, y + 8), 16)
 
-    def _draw_building(self, screen, x, w, h):
+    def _render_building(self, w, h):
+        # render one building into its own surface (roofline adds 4px on top)
+        surf = pygame.Surface((w, h + 4), pygame.SRCALPHA)
+        x, top_y = 0, 4
         # main block
-        top_y = GROUND_Y - h
         rect = pygame.Rect(x, top_y, w, h)
-        pygame.draw.rect(screen, BUILDING_COLOR, rect)
+        pygame.draw.rect(surf, BUILDING_COLOR, rect)
         # simple roofline
-        pygame.draw.rect(screen, (85, 85, 110), (x, top_y - 4, w, 4))
+        pygame.draw.rect(surf, (85, 85, 110), (x, top_y - 4, w, 4))
         # windows grid inside with padding
         pad_x, pad_y = 8, 12
         win_w, win_h = 12, 14
@@ -145,7 +265,7 @@ class Background:
         usable_w = w - 2 * pad_x
         usable_h = h - pad_y - 22  # leave a little footer area
         if usable_w <= 0 or usable_h <= 0:
-            return
+            return surf
         # compute number of columns/rows that fit
         cols = max(1, (usable_w + gap_x) // (win_w + gap_x))
         rows = max(1, (usable_h + gap_y) // (win_h + gap_y))
@@ -153,14 +273,19 @@ class Background:
         grid_w = cols * win_w + (cols - 1) * gap_x
         start_x = x + pad_x + max(0, (usable_w - grid_w) // 2)
         start_y = top_y + pad_y
+        # alternating lit/unlit pattern for visual interest; batch the
+        # stamps per tile through fblits
+        lit_blits = []
+        dark_blits = []
         for r in range(int(rows)):
             for c in range(int(cols)):
                 wx = start_x + c * (win_w + gap_x)
                 wy = start_y + r * (win_h + gap_y)
-                # alternating lit/unlit pattern for visual interest
-                lit = ((r + c) % 2 == 0)
-                color = WINDOW_LIT_COLOR if lit else WINDOW_DARK_COLOR
-                pygame.draw.rect(screen, color, (wx, wy, win_w, win_h), border_radius=2)
+                dest = lit_blits if (r + c) % 2 == 0 else dark_blits
+                dest.append((wx, wy))
+        surf.fblits([(self._win_lit, pos) for pos in lit_blits])
+        surf.fblits([(self._win_dark, pos) for pos in dark_blits])
+        return surf
 
     def _draw_tree(self, screen, x, base_y, size):
         # trunk
@@ -175,7 +300,7 @@ class Background:
         pygame.draw.circle(screen, TREE_LEAF_COLOR, (x - r1 + 6, crown_y + 6), r2 + 4)
         pygame.draw.circle(screen, TREE_LEAF_COLOR, (x + r1 - 6, crown_y + 8), r2 + 2)
 
-    def _draw_grass_patch(self, screen, x, y, blade_heights):
+    def _draw_grass_patch(self, screen, x, y, blades):
         # Draw individual grass blades as small lines/triangles
         grass_colors = [
             (45, 110, 55),   # darker green
@@ -185,12 +310,10 @@ class Background:
             (40, 100, 50),   # dark accent
         ]
         blade_spacing = 4
-        for i, height in enumerate(blade_heights):
+        for i, (height, sway) in enumerate(blades):
             bx = x + i * blade_spacing - 8
             # Draw grass blade as a thin triangle
             color = grass_colors[i % len(grass_colors)]
-            # Slight sway variation based on position
-            sway = int(2 * math.sin(x * 0.1 + i))
             points = [
                 (bx, y),                          # base left
                 (bx + 2, y),                      # base right
@@ -211,10 +334,46 @@ class Background:
 # Helicopter drawing and kinematics
 # -----------------------------
 class Helicopter:
+    # Rigid body geometry as offsets from the fuselage reference (cx, cy);
+    # consumed once by _bake_body, kept as data so the shape is editable
+    # without touching draw code.
+    _TAIL_OFFSETS = (
+        (-40, -8),    # start at body
+        (-120, -4),   # top of tail end
+        (-120, 6),    # bottom of tail end
+        (-40, 12),    # back to body
+    )
+    _TAIL_FIN_OFFSETS = (
+        (-115, -4),
+        (-130, -20),
+        (-140, -20),
+        (-125, 2),
+    )
+    _BODY_OFFSETS = (
+        (-40, -18),   # top left
+        (50, -18),    # top right before nose
+        (75, -10),    # nose top curve
+        (85, 2),      # nose tip
+        (75, 14),     # nose bottom curve
+        (50, 22),     # bottom right
+        (-40, 22),    # bottom left
+    )
+    _WINDOW_OFFSETS = (
+        # Window 1 (leftmost)
+        ((-25, -12), (-8, -12), (-10, 14), (-27, 14)),
+        # Window 2 (middle)
+        ((-3, -12), (16, -12), (14, 14), (-5, 14)),
+        # Window 3 (front, more slanted)
+        ((21, -12), (42, -8), (38, 12), (19, 14)),
+    )
+
     def __init__(self, x, ground_y):
         self.x = float(x)
         self.y = float(ground_y)  # starts on ground
         self.ground_y = ground_y
+        # altitude limits folded once; compared against every step
+        self._ceiling_y = ground_y - 350  # Max height
+        self._altitude_y = ground_y - 50  # "airborne" threshold
         # rotor dynamics
         self.rotor_angle = 0.0
         self.rotor_speed = 0.0  # rad/s
@@ -223,18 +382,110 @@ class Helicopter:
         # geometry
         self.body_h = 42
         self.rotor_len = 100
+        # Pre-render the main rotor at ROTOR_FRAMES discrete orientations;
+        # 32 steps is visually smooth and replaces per-frame trig + line
+        # rasterization with a single blit of the nearest frame.
+        self._rotor_frames = []
+        fw, fh = 2 * self.rotor_len + 8, 24
+        for a in range(ROTOR_FRAMES):
+            angle = 2 * math.pi * a / ROTOR_FRAMES
+            dx = int(math.cos(angle) * self.rotor_len)
+            dy = int(math.sin(angle) * 8)  # flatten for top-down look
+            frame = pygame.Surface((fw, fh), pygame.SRCALPHA)
+            pygame.draw.line(frame, ROTOR_COLOR,
+                             (fw // 2 - dx, fh // 2 - dy),
+                             (fw // 2 + dx, fh // 2 + dy), 6)
+            self._rotor_frames.append(frame.convert_alpha())
+        # The fuselage/tail/windows/skids are rigid, so rasterize them once
+        # into a single body surface; draw() then blits it and overlays only
+        # the two rotors. The anchor is the fuselage reference point (cx, cy).
+        self._body_anchor = (145, 70)
+        self._body_surf = self._bake_body().convert_alpha()
+
+    def _bake_body(self):
+        """One-shot render of the static helicopter body."""
+        surf = pygame.Surface((240, 140), pygame.SRCALPHA)
+        cx, cy = self._body_anchor
+        # one lock for the whole draw batch instead of one per primitive
+        surf.lock()
+
+        # Rotor mast/post and hub (the blades themselves stay dynamic)
+        hub_x = cx + 10
+        hub_y = cy - 38
+        pygame.draw.line(surf, HELI_OUTLINE_COLOR, (hub_x, cy - 18), (hub_x, hub_y), 4)
+        pygame.draw.circle(surf, ROTOR_COLOR, (hub_x, hub_y), 5)
+
+        # === TAIL SECTION ===
+        # Tail boom (tapers towards the back)
+        tail_points = [(cx + dx, cy + dy) for dx, dy in self._TAIL_OFFSETS]
+        pygame.draw.polygon(surf, HELI_BODY_COLOR, tail_points)
+        pygame.draw.polygon(surf, HELI_OUTLINE_COLOR, tail_points, 2)
+
+        # Tail fin (vertical stabilizer)
+        tail_fin = [(cx + dx, cy + dy) for dx, dy in self._TAIL_FIN_OFFSETS]
+        pygame.draw.polygon(surf, HELI_BODY_COLOR, tail_fin)
+        pygame.draw.polygon(surf, HELI_OUTLINE_COLOR, tail_fin, 2)
+
+        # === MAIN BODY (fuselage) ===
+        # Rounded rectangular body shape like in the image
+        body_points = [(cx + dx, cy + dy) for dx, dy in self._BODY_OFFSETS]
+        pygame.draw.polygon(surf, HELI_BODY_COLOR, body_points)
+        pygame.draw.polygon(surf, HELI_OUTLINE_COLOR, body_points, 2)
+
+        # === COCKPIT WINDOWS (light cyan like in image) ===
+        for offsets in self._WINDOW_OFFSETS:
+            pts = [(cx + dx, cy + dy) for dx, dy in offsets]
+            pygame.draw.polygon(surf, HELI_WINDOW_COLOR, pts)
+            pygame.draw.polygon(surf, HELI_OUTLINE_COLOR, pts, 2)
+
+        # === LANDING SKIDS (gray like in image) ===
+        skid_y = cy + 38
+        
+        # Skid rail: rear curve, main bar and front curve form one
+        # continuous polyline, so draw them in a single pass
+        skid_left = cx - 60
+        skid_right = cx + 70
+        skid_path = [
+            (skid_left - 8, skid_y - 6),    # rear curve tip
+            (skid_left, skid_y),
+            (skid_right - 15, skid_y),      # main bar
+            (skid_right - 5, skid_y - 4),   # front curve up
+            (skid_right, skid_y - 10),
+        ]
+        pygame.draw.lines(surf, SKID_COLOR, False, skid_path, 5)
+
+
+        # Struts connecting body to skids
+        strut_top = cy + 22
+        # Front strut
+        pygame.draw.line(surf, SKID_COLOR, (cx + 30, strut_top), (cx + 35, skid_y), 4)
+        # Rear strut
+        pygame.draw.line(surf, SKID_COLOR, (cx - 25, strut_top), (cx - 30, skid_y), 4)
+
+        surf.unlock()
+        return surf
 
     def update_rotor(self, dt, spinning_up=False):
         """Update rotor speed based on input state"""
+        # A stopped rotor that isn't spinning up is a no-op; skip the
+        # clamp math and angle update for the (unbounded) idle frames
+        if not spinning_up and self.rotor_speed == 0.0:
+            return
         if spinning_up:
-            # Accelerate rotor towards max speed
-            self.rotor_speed = min(MAX_ROTOR_SPEED, self.rotor_speed + SPIN_ACCEL * dt)
+            # Accelerate rotor towards max speed; once saturated (the
+            # whole of FLYING/LANDING) only the angle needs advancing
+            if self.rotor_speed != MAX_ROTOR_SPEED:
+                self.rotor_speed = min(MAX_ROTOR_SPEED, self.rotor_speed + SPIN_ACCEL * dt)
         else:
             # Decelerate rotor towards zero
             self.rotor_speed = max(0.0, self.rotor_speed - SPIN_DECEL * dt)
         
-        # Update rotor visual angle
-        self.rotor_angle = (self.rotor_angle + self.rotor_speed * dt) % (2 * math.pi)
+        # Update rotor visual angle; kept unbounded since draw() masks it
+        # into a frame/LUT index anyway, and renormalized only rarely so
+        # float precision never degrades the animation
+        self.rotor_angle += self.rotor_speed * dt
+        if self.rotor_angle > 1e6:
+            self.rotor_angle %= _TWO_PI
 
     def can_fly(self):
         """Check if rotor speed is sufficient for flight"""
@@ -246,14 +497,14 @@ class Helicopter:
             self.vel_y = -MANUAL_VERT_SPEED
         else:
             # Rotor not fast enough, reduced lift
-            lift_factor = self.rotor_speed / MIN_FLIGHT_ROTOR_SPEED
+            lift_factor = self.rotor_speed * _INV_MIN_FLIGHT_ROTOR_SPEED
             self.vel_y = -MANUAL_VERT_SPEED * lift_factor * 0.3
 
     def apply_gravity(self, dt):
         """Apply gravity when not pressing W"""
         if not self.on_ground():
             # Rotor provides some resistance to falling based on speed
-            rotor_lift = (self.rotor_speed / MAX_ROTOR_SPEED) * GRAVITY * 0.8
+            rotor_lift = self.rotor_speed * _ROTOR_LIFT_PER_SPEED
             effective_gravity = GRAVITY - rotor_lift
             self.vel_y = min(LANDING_VS, self.vel_y + effective_gravity * dt)
         else:
@@ -263,8 +514,7 @@ class Helicopter:
         """Update vertical position based on velocity"""
         self.y += self.vel_y * dt
         # Clamp to boundaries
-        min_altitude = self.ground_y - 350  # Max height
-        self.y = max(min_altitude, min(self.ground_y, self.y))
+        self.y = max(self._ceiling_y, min(self.ground_y, self.y))
         # Stop at ground
         if self.y >= self.ground_y:
             self.y = self.ground_y
@@ -288,136 +538,36 @@ class Helicopter:
         return self.y >= self.ground_y - 1.0
 
     def at_altitude(self):
-        return self.y <= self.ground_y - 50  # At least 50px off ground
+        return self.y <= self._altitude_y  # At least 50px off ground
 
-    def draw(self, screen):
+    def draw(self, screen, x=None, y=None, rotor_angle=None):
+        # callers may pass interpolated pose values for smooth rendering
+        if x is None:
+            x, y, rotor_angle = self.x, self.y, self.rotor_angle
         # center reference for fuselage
-        cx, cy = int(self.x), int(self.y - self.body_h // 2)
+        cx, cy = int(x), int(y - self.body_h // 2)
+        ax, ay = self._body_anchor
 
-        # === MAIN ROTOR (draw first so it appears behind body) ===
+        # Main rotor first so the blades stay behind the hub/body as before
         hub_x = cx + 10
         hub_y = cy - 38
-        # Rotor mast/post
-        pygame.draw.line(screen, HELI_OUTLINE_COLOR, (hub_x, cy - 18), (hub_x, hub_y), 4)
-        # Rotating main rotor blades (long horizontal bar)
-        bx1 = hub_x + int(math.cos(self.rotor_angle) * self.rotor_len)
-        by1 = hub_y + int(math.sin(self.rotor_angle) * 8)  # flatten for top-down look
-        bx2 = hub_x + int(math.cos(self.rotor_angle + math.pi) * self.rotor_len)
-        by2 = hub_y + int(math.sin(self.rotor_angle + math.pi) * 8)
-        pygame.draw.line(screen, ROTOR_COLOR, (bx1, by1), (bx2, by2), 6)
-        # Hub circle
-        pygame.draw.circle(screen, ROTOR_COLOR, (hub_x, hub_y), 5)
+        idx = int(rotor_angle * _ROTOR_FRAME_SCALE) & (ROTOR_FRAMES - 1)
+        frame = self._rotor_frames[idx]
+        screen.blit(frame, (hub_x - frame.get_width() // 2,
+                            hub_y - frame.get_height() // 2))
 
-        # === TAIL SECTION ===
-        # Tail boom (tapers towards the back)
-        tail_points = [
-            (cx - 40, cy - 8),    # start at body
-            (cx - 120, cy - 4),   # top of tail end
-            (cx - 120, cy + 6),   # bottom of tail end  
-            (cx - 40, cy + 12),   # back to body
-        ]
-        pygame.draw.polygon(screen, HELI_BODY_COLOR, tail_points)
-        pygame.draw.polygon(screen, HELI_OUTLINE_COLOR, tail_points, 2)
-
-        # Tail fin (vertical stabilizer)
-        tail_fin = [
-            (cx - 115, cy - 4),
-            (cx - 130, cy - 20),
-            (cx - 140, cy - 20),
-            (cx - 125, cy + 2),
-        ]
-        pygame.draw.polygon(screen, HELI_BODY_COLOR, tail_fin)
-        pygame.draw.polygon(screen, HELI_OUTLINE_COLOR, tail_fin, 2)
+        # Static body: single blit of the pre-rendered surface
+        screen.blit(self._body_surf, (cx - ax, cy - ay))
 
         # Tail rotor (small rotating blade on tail)
         tail_rotor_x = cx - 138
         tail_rotor_y = cy - 12
-        tr_angle = self.rotor_angle * 3.0
         tr_len = 14
-        trx1 = tail_rotor_x
-        try1 = tail_rotor_y + int(math.sin(tr_angle) * tr_len)
-        trx2 = tail_rotor_x
-        try2 = tail_rotor_y + int(math.sin(tr_angle + math.pi) * tr_len)
-        pygame.draw.line(screen, ROTOR_COLOR, (trx1, try1), (trx2, try2), 4)
-
-        # === MAIN BODY (fuselage) ===
-        # Rounded rectangular body shape like in the image
-        body_points = [
-            (cx - 40, cy - 18),   # top left
-            (cx + 50, cy - 18),   # top right before nose
-            (cx + 75, cy - 10),   # nose top curve
-            (cx + 85, cy + 2),    # nose tip
-            (cx + 75, cy + 14),   # nose bottom curve
-            (cx + 50, cy + 22),   # bottom right
-            (cx - 40, cy + 22),   # bottom left
-        ]
-        pygame.draw.polygon(screen, HELI_BODY_COLOR, body_points)
-        pygame.draw.polygon(screen, HELI_OUTLINE_COLOR, body_points, 2)
-
-        # === COCKPIT WINDOWS (light cyan like in image) ===
-        win_top = cy - 12
-        win_bot = cy + 14
-        
-        # Three rectangular windows with slight slant
-        # Window 1 (leftmost)
-        w1 = [
-            (cx - 25, win_top),
-            (cx - 8, win_top),
-            (cx - 10, win_bot),
-            (cx - 27, win_bot),
-        ]
-        pygame.draw.polygon(screen, HELI_WINDOW_COLOR, w1)
-        pygame.draw.polygon(screen, HELI_OUTLINE_COLOR, w1, 2)
-        
-        # Window 2 (middle)
-        w2 = [
-            (cx - 3, win_top),
-            (cx + 16, win_top),
-            (cx + 14, win_bot),
-            (cx - 5, win_bot),
-        ]
-        pygame.draw.polygon(screen, HELI_WINDOW_COLOR, w2)
-        pygame.draw.polygon(screen, HELI_OUTLINE_COLOR, w2, 2)
-        
-        # Window 3 (front, more slanted)
-        w3 = [
-            (cx + 21, win_top),
-            (cx + 42, win_top + 4),
-            (cx + 38, win_bot - 2),
-            (cx + 19, win_bot),
-        ]
-        pygame.draw.polygon(screen, HELI_WINDOW_COLOR, w3)
-        pygame.draw.polygon(screen, HELI_OUTLINE_COLOR, w3, 2)
-
-        # === LANDING SKIDS (gray like in image) ===
-        skid_y = cy + 38
-        
-        # Left skid (long horizontal bar with curved front)
-        skid_left = cx - 60
-        skid_right = cx + 70
-        # Main skid bar
-        pygame.draw.line(screen, SKID_COLOR, (skid_left, skid_y), (skid_right - 15, skid_y), 5)
-        # Front curve up
-        skid_curve = [
-            (skid_right - 15, skid_y),
-            (skid_right - 5, skid_y - 4),
-            (skid_right, skid_y - 10),
-        ]
-        pygame.draw.lines(screen, SKID_COLOR, False, skid_curve, 5)
-        
-        # Rear curve up (slight)
-        rear_curve = [
-            (skid_left, skid_y),
-            (skid_left - 8, skid_y - 6),
-        ]
-        pygame.draw.lines(screen, SKID_COLOR, False, rear_curve, 5)
-        
-        # Struts connecting body to skids
-        strut_top = cy + 22
-        # Front strut
-        pygame.draw.line(screen, SKID_COLOR, (cx + 30, strut_top), (cx + 35, skid_y), 4)
-        # Rear strut  
-        pygame.draw.line(screen, SKID_COLOR, (cx - 25, strut_top), (cx - 30, skid_y), 4)
+        _, tr_sin = _trig(rotor_angle * 3.0)
+        tr_dy = int(tr_sin * tr_len)
+        pygame.draw.line(screen, ROTOR_COLOR,
+                         (tail_rotor_x, tail_rotor_y + tr_dy),
+                         (tail_rotor_x, tail_rotor_y - tr_dy), 4)
 
 
 # -----------------------------
@@ -427,7 +577,10 @@ class Simulation:
     def __init__(self):
         pygame.init()
         pygame.display.set_caption("HeliMotion - Keyboard Controls")
-        self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
+        # SCALED routes presentation through the GPU renderer (and makes
+        # the vsync request effective on more platforms)
+        self.screen = pygame.display.set_mode((WIDTH, HEIGHT),
+                                              pygame.SCALED | pygame.DOUBLEBUF, vsync=1)
         self.clock = pygame.time.Clock()
         self.font = pygame.font.SysFont("consolas", 16)
         self.font_large = pygame.font.SysFont("consolas", 20, bold=True)
@@ -437,204 +590,284 @@ class Simulation:
         # state
         self.state = FlightState.IDLE
         self.time_in_state = 0.0
+        # HUD text: the controls panel never changes, so render it once;
+        # dynamic labels go through a small string-keyed surface cache
+        # (font.render is one of the most expensive per-frame calls).
+        self._controls = [
+            "W - Ascend",
+            "A - Left",
+            "D - Right",
+            "S - Land",
+        ]
+        self._control_surfs = [self.font.render(c, True, (220, 220, 220)).convert_alpha()
+                               for c in self._controls]
+        self._controls_title = self.font_large.render("CONTROLS", True, (255, 255, 255)).convert_alpha()
+        self._hud_cache = {}
+        # warm the cache with the five state labels so no flight-state
+        # transition ever pays a font.render mid-game
+        for name in ("IDLE", "SPINNING UP", "FLYING", "LANDING", "SPIN DOWN"):
+            self._text(f"State: {name}", self.font, TEXT_COLOR)
+        # dirty-rect bookkeeping for draw()
+        self._prev_scroll = None
+        self._prev_heli_rect = None
+        self._needs_redraw = True
+        # pose at the previous physics step, for render interpolation
+        self._prev_pose = (self.heli.x, self.heli.y,
+                           self.heli.rotor_angle, self.bg.offset_x)
+        # Per-state update handlers indexed by FlightState value; update()
+        # dispatches through this tuple instead of an if/elif chain
+        self._state_handlers = (
+            self._tick_idle,
+            self._tick_spinning_up,
+            self._tick_flying,
+            self._tick_landing,
+            self._tick_spin_down,
+        )
+
+    def _text(self, s, font, color):
+        """Render text via cache; identical strings cost a dict lookup."""
+        key = (s, id(font), color)
+        surf = self._hud_cache.get(key)
+        if surf is None:
+            if len(self._hud_cache) >= 64:
+                self._hud_cache.clear()
+            surf = font.render(s, True, color).convert_alpha()
+            self._hud_cache[key] = surf
+        return surf
 
     def change_state(self, new_state):
         self.state = new_state
         self.time_in_state = 0.0
-
-    def handle_input(self):
-        """Get current keyboard state using pygame's efficient key polling"""
-        keys = pygame.key.get_pressed()
-        return {
-            'w': keys[pygame.K_w],
-            'a': keys[pygame.K_a],
-            's': keys[pygame.K_s],
-            'd': keys[pygame.K_d],
-        }
+        self._needs_redraw = True
 
     def update(self, dt):
+        # remember the pre-step pose so draw() can interpolate between steps
+        self._prev_pose = (self.heli.x, self.heli.y,
+                           self.heli.rotor_angle, self.bg.offset_x)
         self.time_in_state += dt
-        
-        # Get current input state
-        inputs = self.handle_input()
-        w_held = inputs['w']
-        a_held = inputs['a']
-        s_held = inputs['s']
-        d_held = inputs['d']
-        
-        # State machine logic
-        if self.state == FlightState.IDLE:
-            # On ground, waiting for input
-            self.heli.update_rotor(dt, spinning_up=False)
-            
-            # W key starts spinning up rotors
-            if w_held:
-                self.change_state(FlightState.SPINNING_UP)
-        
-        elif self.state == FlightState.SPINNING_UP:
-            # W is held, rotors are spinning up
-            if w_held:
-                self.heli.update_rotor(dt, spinning_up=True)
-                
-                # Once rotor is fast enough and W is still held, apply lift
-                if self.heli.can_fly():
-                    self.heli.apply_lift(dt)
-                    self.heli.update_position(dt)
-                    
-                    # Transition to flying once airborne
-                    if self.heli.at_altitude():
-                        self.change_state(FlightState.FLYING)
-                elif self.heli.rotor_speed > MIN_FLIGHT_ROTOR_SPEED * 0.5:
-                    # Partial lift as rotors spin up
-                    self.heli.apply_lift(dt)
-                    self.heli.update_position(dt)
-            else:
-                # W released - start spinning down
-                self.heli.update_rotor(dt, spinning_up=False)
-                self.heli.apply_gravity(dt)
+
+        # Current keyboard state; the ScancodeWrapper is O(1) indexable,
+        # so read it directly instead of copying into a dict
+        keys = pygame.key.get_pressed()
+        w_held = keys[_K_W]
+        a_held = keys[_K_A]
+        s_held = keys[_K_S]
+        d_held = keys[_K_D]
+
+        # Anything that can move this frame forces a redraw; otherwise the
+        # scene is static (e.g. parked with rotors stopped) and draw() can
+        # be skipped entirely by run()
+        if (w_held or a_held or s_held or d_held
+                or self.heli.rotor_speed > 0.05 or not self.heli.on_ground()):
+            self._needs_redraw = True
+
+        # Dispatch straight to the current state's handler instead of
+        # walking an if/elif chain every tick
+        self._state_handlers[self.state](dt, w_held, a_held, s_held, d_held)
+
+    def _tick_idle(self, dt, w_held, a_held, s_held, d_held):
+        # On ground, waiting for input
+        self.heli.update_rotor(dt, spinning_up=False)
+
+        # W key starts spinning up rotors
+        if w_held:
+            self.change_state(FlightState.SPINNING_UP)
+
+    def _tick_spinning_up(self, dt, w_held, a_held, s_held, d_held):
+        # W is held, rotors are spinning up
+        if w_held:
+            self.heli.update_rotor(dt, spinning_up=True)
+
+            # Once rotor is fast enough and W is still held, apply lift
+            if self.heli.can_fly():
+                self.heli.apply_lift(dt)
                 self.heli.update_position(dt)
-                
-                # Return to idle if on ground and rotors stopped
-                if self.heli.on_ground() and self.heli.rotor_speed < 0.5:
-                    self.change_state(FlightState.IDLE)
-        
-        elif self.state == FlightState.FLYING:
-            # Full flight control mode
-            
-            # S key initiates landing
-            if s_held:
-                self.change_state(FlightState.LANDING)
-                return
-            
-            # W key for lift / altitude
-            if w_held:
-                self.heli.update_rotor(dt, spinning_up=True)
+
+                # Transition to flying once airborne
+                if self.heli.at_altitude():
+                    self.change_state(FlightState.FLYING)
+            elif self.heli.rotor_speed > _PARTIAL_LIFT_ROTOR_SPEED:
+                # Partial lift as rotors spin up
                 self.heli.apply_lift(dt)
-            else:
-                # Maintain rotor speed but apply gravity
-                self.heli.update_rotor(dt, spinning_up=True)  # Keep rotors spinning in flight
-                self.heli.apply_gravity(dt)
-            
-            # A/D for horizontal movement with background parallax
-            if a_held and not d_held:
-                self.bg.update_scroll(dt, direction=-1)  # Scroll background right (moving left)
-            elif d_held and not a_held:
-                self.bg.update_scroll(dt, direction=1)   # Scroll background left (moving right)
-            
-            # Update position
-            self.heli.update_position(dt)
-            
-            # Check if helicopter touched ground (emergency landing)
-            if self.heli.on_ground():
-                self.change_state(FlightState.SPIN_DOWN)
-        
-        elif self.state == FlightState.LANDING:
-            # Controlled descent
-            self.heli.update_rotor(dt, spinning_up=True)  # Keep rotors at speed
-            self.heli.descend_landing(dt)
-            
-            # A/D still work during landing for positioning
-            if a_held and not d_held:
-                self.bg.update_scroll(dt, direction=-1)
-            elif d_held and not a_held:
-                self.bg.update_scroll(dt, direction=1)
-            
-            # Cancel landing with W
-            if w_held and not self.heli.on_ground():
-                self.change_state(FlightState.FLYING)
-                return
-            
-            # Landed successfully
-            if self.heli.on_ground():
-                self.change_state(FlightState.SPIN_DOWN)
-        
-        elif self.state == FlightState.SPIN_DOWN:
-            # On ground, rotors spinning down
+                self.heli.update_position(dt)
+        else:
+            # W released - start spinning down
             self.heli.update_rotor(dt, spinning_up=False)
-            
-            # Can restart by pressing W
-            if w_held:
-                self.change_state(FlightState.SPINNING_UP)
-                return
-            
-            # Fully stopped
-            if self.heli.rotor_speed < 0.1:
+            self.heli.apply_gravity(dt)
+            self.heli.update_position(dt)
+
+            # Return to idle if on ground and rotors stopped
+            if self.heli.on_ground() and self.heli.rotor_speed < 0.5:
                 self.change_state(FlightState.IDLE)
 
-    def draw(self):
-        self.bg.draw(self.screen)
-        self.heli.draw(self.screen)
+    def _tick_flying(self, dt, w_held, a_held, s_held, d_held):
+        # Full flight control mode
+
+        # S key initiates landing
+        if s_held:
+            self.change_state(FlightState.LANDING)
+            return
+
+        # W key for lift / altitude
+        if w_held:
+            self.heli.update_rotor(dt, spinning_up=True)
+            self.heli.apply_lift(dt)
+        else:
+            # Maintain rotor speed but apply gravity
+            self.heli.update_rotor(dt, spinning_up=True)  # Keep rotors spinning in flight
+            self.heli.apply_gravity(dt)
+
+        # A/D for horizontal movement with background parallax
+        if a_held and not d_held:
+            self.bg.update_scroll(dt, direction=-1)  # Scroll background right (moving left)
+        elif d_held and not a_held:
+            self.bg.update_scroll(dt, direction=1)   # Scroll background left (moving right)
+
+        # Update position
+        self.heli.update_position(dt)
+
+        # Check if helicopter touched ground (emergency landing)
+        if self.heli.on_ground():
+            self.change_state(FlightState.SPIN_DOWN)
+
+    def _tick_landing(self, dt, w_held, a_held, s_held, d_held):
+        # Controlled descent
+        self.heli.update_rotor(dt, spinning_up=True)  # Keep rotors at speed
+        self.heli.descend_landing(dt)
+
+        # A/D still work during landing for positioning
+        if a_held and not d_held:
+            self.bg.update_scroll(dt, direction=-1)
+        elif d_held and not a_held:
+            self.bg.update_scroll(dt, direction=1)
+
+        # Cancel landing with W
+        if w_held and not self.heli.on_ground():
+            self.change_state(FlightState.FLYING)
+            return
+
+        # Landed successfully
+        if self.heli.on_ground():
+            self.change_state(FlightState.SPIN_DOWN)
+
+    def _tick_spin_down(self, dt, w_held, a_held, s_held, d_held):
+        # On ground, rotors spinning down
+        self.heli.update_rotor(dt, spinning_up=False)
+
+        # Can restart by pressing W
+        if w_held:
+            self.change_state(FlightState.SPINNING_UP)
+            return
+
+        # Fully stopped
+        if self.heli.rotor_speed < 0.1:
+            self.change_state(FlightState.IDLE)
+
+    # Screen region covered by the dynamic HUD readouts (top-left block)
+    _HUD_RECT = pygame.Rect(0, 0, 220, 75)
+
+    def draw(self, alpha=1.0):
+        # Lerp between the previous and current physics poses so rendering
+        # stays smooth regardless of where the frame lands between steps
+        heli = self.heli
+        px, py, pang, poff = self._prev_pose
+        hx = px + (heli.x - px) * alpha
+        hy = py + (heli.y - py) * alpha
+        hang = pang + (heli.rotor_angle - pang) * alpha
+        off = poff + (self.bg.offset_x - poff) * alpha
+
+        self.bg.draw(self.screen, off)
+        heli.draw(self.screen, hx, hy, hang)
         self._draw_hud()
-        pygame.display.flip()
+        # When the world is not scrolling only the helicopter and the HUD
+        # readouts change, so push just those regions to the window; any
+        # scroll invalidates the whole frame and falls back to a flip.
+        scroll = int(off)
+        heli_rect = self._heli_rect(hx, hy)
+        if self._prev_scroll is None or scroll != self._prev_scroll:
+            pygame.display.flip()
+        else:
+            rects = [self._HUD_RECT, heli_rect]
+            if self._prev_heli_rect is not None:
+                rects.append(self._prev_heli_rect)
+            pygame.display.update(rects)
+        self._prev_scroll = scroll
+        self._prev_heli_rect = heli_rect
+
+    def _heli_rect(self, x, y):
+        """Bounding box of the helicopter including the rotor overhang."""
+        cx = int(x)
+        cy = int(y - self.heli.body_h // 2)
+        return pygame.Rect(cx - 150, cy - 75, 270, 155)
 
     def _draw_hud(self):
+        # Bind the hot lookups once; this method runs every frame and
+        # touches the screen/heli/font a dozen times
+        screen = self.screen
+        blit = screen.blit
+        draw_rect = pygame.draw.rect
+        heli = self.heli
+        font = self.font
+
         # State display
         state_text = f"State: {self._state_name(self.state)}"
-        state_surf = self.font.render(state_text, True, TEXT_COLOR)
-        self.screen.blit(state_surf, (12, 10))
-        
+        blit(self._text(state_text, font, TEXT_COLOR), (12, 10))
+
         # Rotor speed indicator with proper spacing
-        rotor_pct = int((self.heli.rotor_speed / MAX_ROTOR_SPEED) * 100)
-        rotor_text = f"Rotor:"
-        rotor_surf = self.font.render(rotor_text, True, TEXT_COLOR)
-        self.screen.blit(rotor_surf, (12, 30))
-        
+        rotor_pct = int((heli.rotor_speed / MAX_ROTOR_SPEED) * 100)
+        blit(self._text("Rotor:", font, TEXT_COLOR), (12, 30))
+
         # Rotor power bar (positioned after label)
         bar_x, bar_y = 70, 32
         bar_w, bar_h = 80, 14
-        pygame.draw.rect(self.screen, (60, 60, 60), (bar_x, bar_y, bar_w, bar_h))
-        fill_w = int(bar_w * (self.heli.rotor_speed / MAX_ROTOR_SPEED))
-        bar_color = (50, 200, 50) if self.heli.can_fly() else (200, 200, 50)
-        pygame.draw.rect(self.screen, bar_color, (bar_x, bar_y, fill_w, bar_h))
-        pygame.draw.rect(self.screen, TEXT_COLOR, (bar_x, bar_y, bar_w, bar_h), 1)
-        
+        draw_rect(screen, (60, 60, 60), (bar_x, bar_y, bar_w, bar_h))
+        fill_w = int(bar_w * (heli.rotor_speed / MAX_ROTOR_SPEED))
+        bar_color = (50, 200, 50) if heli.can_fly() else (200, 200, 50)
+        draw_rect(screen, bar_color, (bar_x, bar_y, fill_w, bar_h))
+        draw_rect(screen, TEXT_COLOR, (bar_x, bar_y, bar_w, bar_h), 1)
+
         # Percentage text after bar
-        pct_text = f"{rotor_pct}%"
-        pct_surf = self.font.render(pct_text, True, TEXT_COLOR)
-        self.screen.blit(pct_surf, (bar_x + bar_w + 8, 30))
-        
+        blit(self._text(f"{rotor_pct}%", font, TEXT_COLOR), (bar_x + bar_w + 8, 30))
+
         # Altitude indicator
-        altitude = int(self.heli.ground_y - self.heli.y)
-        alt_text = f"Altitude: {altitude}px"
-        alt_surf = self.font.render(alt_text, True, TEXT_COLOR)
-        self.screen.blit(alt_surf, (12, 52))
-        
-        # Controls help (always visible)
-        controls = [
-            "W - Ascend",
-            "A - Left",
-            "D - Right", 
-            "S - Land",
-        ]
-        
+        altitude = int(heli.ground_y - heli.y)
+        blit(self._text(f"Altitude: {altitude}px", font, TEXT_COLOR), (12, 52))
+
         # Draw controls panel
         panel_x = WIDTH - 140
         panel_y = 10
         panel_w = 130
         panel_h = 95
-        pygame.draw.rect(self.screen, (30, 30, 40), (panel_x - 8, panel_y - 5, panel_w, panel_h), border_radius=6)
-        pygame.draw.rect(self.screen, (100, 100, 120), (panel_x - 8, panel_y - 5, panel_w, panel_h), 2, border_radius=6)
-        
-        title_surf = self.font_large.render("CONTROLS", True, (255, 255, 255))
-        self.screen.blit(title_surf, (panel_x, panel_y))
-        
-        for i, ctrl in enumerate(controls):
-            ctrl_surf = self.font.render(ctrl, True, (220, 220, 220))
-            self.screen.blit(ctrl_surf, (panel_x, panel_y + 22 + i * 17))
+        draw_rect(screen, (30, 30, 40), (panel_x - 8, panel_y - 5, panel_w, panel_h), border_radius=6)
+        draw_rect(screen, (100, 100, 120), (panel_x - 8, panel_y - 5, panel_w, panel_h), 2, border_radius=6)
+
+        blit(self._controls_title, (panel_x, panel_y))
+
+        for i, ctrl_surf in enumerate(self._control_surfs):
+            blit(ctrl_surf, (panel_x, panel_y + 22 + i * 17))
 
     def _state_name(self, s):
-        return {
-            FlightState.IDLE: "IDLE",
-            FlightState.SPINNING_UP: "SPINNING UP",
-            FlightState.FLYING: "FLYING",
-            FlightState.LANDING: "LANDING",
-            FlightState.SPIN_DOWN: "SPIN DOWN",
-        }.get(s, "UNKNOWN")
+        return _STATE_NAMES[s] if 0 <= s < len(_STATE_NAMES) else "UNKNOWN"
 
     def run(self):
+        # Only QUIT and KEYDOWN are consumed below (held keys go through
+        # key.get_pressed, which works off the event pump's internal
+        # state), so block everything else at the SDL layer - mouse
+        # motion etc. never enters the queue instead of being drained
+        # and discarded every frame
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed((pygame.QUIT, pygame.KEYDOWN))
         running = True
+        prev_t = time.monotonic()
+        accum = 0.0
         while running:
-            dt = self.clock.tick(FPS) / 1000.0  # seconds per frame
+            # vsync paces the flip; tick(FPS) stays as a cap for drivers
+            # without vsync support. dt comes from the monotonic clock,
+            # clamped so a stall can't teleport the physics.
+            self.clock.tick(FPS)
+            now = time.monotonic()
+            dt = min(now - prev_t, 1.0 / 30.0)
+            prev_t = now
             
             # Event handling (only for quit)
             for event in pygame.event.get():
@@ -644,9 +877,23 @@ class Simulation:
                     if event.key == pygame.K_ESCAPE:
                         running = False
             
-            self.update(dt)
-            self.draw()
-        
+            # Nothing to push while minimized; sleep instead of spinning
+            if not pygame.display.get_active():
+                time.sleep(0.05)
+                prev_t = time.monotonic()
+                continue
+
+            # Fixed-timestep physics: run as many whole steps as the frame
+            # time covers, then render once with the fractional remainder
+            # as the interpolation factor.
+            accum += dt
+            while accum >= PHYS_DT:
+                self.update(PHYS_DT)
+                accum -= PHYS_DT
+            if self._needs_redraw:
+                self.draw(accum / PHYS_DT)
+                self._needs_redraw = False
+
         pygame.quit()
         return 0
 